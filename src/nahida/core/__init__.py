@@ -3,6 +3,7 @@ from . import errors
 from ._objbase import get_entity, has_entity
 from .context import *
 from .executor import *
+from .fusion import *
 from .graph import *
 from .node import *
 from .scheduler import *
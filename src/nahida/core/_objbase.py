@@ -7,8 +7,9 @@ __all__ = ["UIDMixin", "has_entity", "get_entity", "NameMixin"]
 
 class UIDMixin:
     """Support UID generated by uuid4()."""
+    __slots__ = ("_uid",)
     _uid_registry: dict[int, UIDMixin] = {}
-    _uid: int | None = None
+    _uid: int | None
 
     def __init__(self, *, uid: int | None = None) -> None:
         self._uid = uid
@@ -21,12 +22,15 @@ class UIDMixin:
     @property
     def uid(self) -> int:
         """Get unique ID of the object."""
-        if self._uid is None:
+        # The slot is unset for subclasses not calling `UIDMixin.__init__`.
+        uid = getattr(self, "_uid", None)
+
+        if uid is None:
             from uuid import uuid4
-            self._uid = int(uuid4())
-            self._uid_registry[self._uid] = self
+            uid = self._uid = int(uuid4())
+            self._uid_registry[uid] = self
 
-        return self._uid
+        return uid
 
 
 def has_entity(uid: int, type_check: type | None = None, /) -> bool:
@@ -34,11 +38,10 @@ def has_entity(uid: int, type_check: type | None = None, /) -> bool:
 
     When `type_check` is specified, also check if the entity is an instance of
     the given type."""
-    if uid in UIDMixin._uid_registry:
-        if type_check is None:
-            return True
-        return isinstance(UIDMixin._uid_registry[uid], type_check)
-    return False
+    obj = UIDMixin._uid_registry.get(uid)
+    if obj is None:
+        return False
+    return type_check is None or isinstance(obj, type_check)
 
 
 @overload
@@ -47,9 +50,9 @@ def get_entity(uid: int, /) -> Any: ...
 def get_entity[T](uid: int, type_guard: type[T], /) -> T: ...
 def get_entity(uid: int, type_guard: type | None = None, /) -> Any:
     """Get an entity by its global UID."""
-    obj = UIDMixin._uid_registry.get(uid, None)
+    obj = UIDMixin._uid_registry.get(uid)
 
-    if not obj:
+    if obj is None:
         raise KeyError(f"entity with uid {uid} not found.")
 
     if type_guard and not isinstance(obj, type_guard):
@@ -59,7 +62,11 @@ def get_entity(uid: int, type_guard: type | None = None, /) -> Any:
 
 
 class NameMixin:
-    """Support unique names for __repr__."""
+    """Support unique names for __repr__.
+
+    Slotted subclasses should declare `_uname` in their `__slots__`.
+    """
+    __slots__ = ()
     _uname: str | None = None
 
     def __repr__(self) -> str:
@@ -78,4 +85,4 @@ class NameMixin:
         return super().__repr__()
 
     def set_name(self, name: str | None, /):
-        self._uname = name
+        self._uname = name # type: ignore[misc] # slot declared by subclasses
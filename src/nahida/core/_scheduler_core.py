@@ -0,0 +1,82 @@
+# nahida/core/_scheduler_core.py
+"""Scheduler bookkeeping kept free of dynamic features, so that it can be
+compiled with mypyc."""
+
+from __future__ import annotations
+
+__all__ = ["ScopeManager"]
+
+from collections.abc import Generator
+from typing import Any, Final
+
+type Coroutine = Generator[Any, Any, Any]
+
+
+class ScopeManager:
+    """Bookkeeping of the scopes in a forward pass.
+
+    Scope fields are stored in parallel arrays indexed by scope ID, where
+    scope 0 is the root scope holding the starters:
+      - `counts`: number of unfinished coroutines in the scope,
+      - `recalls`: the awaiting coroutine to recall when the scope is done,
+      - `back_ids`: ID of the scope to return to,
+      - `cancelled`: 1 if the scope was cancelled, otherwise 0,
+      - `done`: 1 if the scope has no unfinished coroutines or was
+        cancelled, otherwise 0. Kept up to date by the mutating methods.
+    """
+    counts: Final[list[int]]
+    recalls: Final[list[Coroutine | None]]
+    back_ids: Final[list[int | None]]
+    cancelled: Final[bytearray]
+    done: Final[bytearray]
+
+    def __init__(self, num_starters: int) -> None:
+        self.counts = [num_starters]
+        self.recalls = [None]
+        self.back_ids = [None]
+        self.cancelled = bytearray(1)
+        self.done = bytearray((int(num_starters < 1),))
+
+    def __contains__(self, item: int) -> bool:
+        return 0 <= item < len(self.counts)
+
+    def create_scope(self, back_id: int, recall: Coroutine) -> int:
+        new_id = len(self.counts)
+        self.counts.append(0)
+        self.recalls.append(recall)
+        self.back_ids.append(back_id)
+        self.cancelled.append(0)
+        self.done.append(1)
+        return new_id
+
+    def on_node_complete(self, scope_id: int) -> None:
+        count = self.counts[scope_id] - 1
+        self.counts[scope_id] = count
+        if count < 1:
+            self.done[scope_id] = 1
+
+    def on_recruit(self, scope_id: int, n: int) -> None:
+        count = self.counts[scope_id] + n
+        self.counts[scope_id] = count
+        if count >= 1 and not self.cancelled[scope_id]:
+            self.done[scope_id] = 0
+
+    def cancel_scope(self, scope_id: int) -> int:
+        self.cancelled[scope_id] = 1
+        self.done[scope_id] = 1
+        back_id = self.back_ids[scope_id]
+        if back_id is None:
+            raise RuntimeError("cannot cancel the root scope as "
+                               "no back scope found")
+        return back_id
+
+    def check_scope_done(self, scope_id: int) -> bool:
+        return self.done[scope_id] == 1
+
+    def get_recall(self, scope_id: int) -> tuple[Coroutine, int] | None:
+        recall = self.recalls[scope_id]
+
+        if recall is not None:
+            # create_scope() always sets both recall and back_id.
+            return recall, self.back_ids[scope_id] # type: ignore
+        return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 __all__ = ["DataRef", "SimpleDataRef", "Context"]
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, Protocol, Self
 
 
@@ -65,7 +65,7 @@ class Context:
     def new(self, value: Any = empty, /):
         return self._data_ref_factory(value)
 
-    def view(self, uids: set[int], /) -> Context:
+    def view(self, uids: Iterable[int], /) -> Context:
         ctx = Context()
         for index in uids:
             try:
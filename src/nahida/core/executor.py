@@ -2,21 +2,23 @@
 __all__ = [
     "ErrorInfo",
     "ExecEvent",
+    "TaskSpec",
     "Executor",
     "ThreadPoolExecutor"
 ]
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from concurrent.futures import Future
 from dataclasses import dataclass, field, asdict
 from enum import StrEnum
-from typing import Any, NewType
+from typing import Any, Literal, NewType
 
 from .context import Context, DataRef
 from .expr import Expr
 
 
 TaskID = NewType("TaskID", str)
+type JitMode = Literal["numba", "auto"]
 
 @dataclass(slots=True, frozen=True)
 class TaskItem:
@@ -61,12 +63,71 @@ class ExecEvent:
         return self.status == TaskStatus.CANCELLED
 
 
+type TaskSpec = tuple[
+    int | str,
+    Context,
+    tuple[Expr, ...],
+    dict[str, Expr],
+    Callable[[ExecEvent], Any] | None
+]
+
+
+def _is_jit_eligible(target: Callable[..., Any], /) -> bool:
+    """Check if the target is a plain top-level function with a fixed
+    signature, which is what `numba.njit` is able to type."""
+    from inspect import Parameter, isfunction, signature
+
+    if not isfunction(target):
+        return False
+    if target.__qualname__ != target.__name__ or target.__name__ == "<lambda>":
+        return False
+
+    fixed = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    return all(p.kind in fixed for p in signature(target).parameters.values())
+
+
+class _JitFallback:
+    """Callable running a numba-compiled function, switching to the original
+    function for good once numba fails to compile it."""
+    __slots__ = ("__name__", "_compiled", "_target", "_errors")
+
+    def __init__(
+        self,
+        compiled: Callable[..., Any],
+        target: Callable[..., Any],
+        errors: tuple[type[Exception], ...]
+    ) -> None:
+        self.__name__ = target.__name__
+        self._compiled = compiled
+        self._target = target
+        self._errors = errors
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        # numba compiles lazily, on the first call with each argument types.
+        try:
+            return self._compiled(*args, **kwargs)
+        except self._errors:
+            self._compiled = self._target
+            return self._target(*args, **kwargs)
+
+
 class Executor:
     _callable_registry: dict[int, Callable[..., Any]] = {}
+    _fid_by_callable: dict[int, int] = {}
+    _jit_registry: dict[int, int] = {}
 
     @classmethod
     def register(cls, target: Callable[..., Any], *, fid: int | None = None) -> int:
+        """Register a callable and return its ID.
+
+        Registering the same callable object again without an explicit `fid`
+        returns the ID it was first registered with.
+        """
         if fid is None:
+            # Registered callables are never released, so their id() is stable.
+            if id(target) in cls._fid_by_callable:
+                return cls._fid_by_callable[id(target)]
+
             if hasattr(target, "__name__"):
                 fid = hash(target.__name__)
                 while fid in cls._callable_registry:
@@ -78,9 +139,71 @@ class Executor:
             raise KeyError(f"id {fid} already exist")
 
         cls._callable_registry[fid] = target
+        cls._fid_by_callable.setdefault(id(target), fid)
 
         return fid
 
+    @classmethod
+    def jit(cls, fid: int, mode: JitMode = "auto", /) -> int:
+        """Register a Numba-compiled version of a registered callable.
+
+        The callable is wrapped by `numba.njit(cache=True, nogil=True)` only
+        once, and the compiled version is shared by all later requests.
+        Compiled kernels release the GIL, so that thread pool executors can
+        run them in parallel.
+
+        Args:
+            fid (int): ID of the registered callable.
+            mode ("numba" | "auto", optional): In "numba" mode, raise if numba
+                is not installed or the callable is not a plain top-level
+                function. In "auto" mode, fall back to the original callable
+                silently, also when numba fails to decorate it or to compile
+                it on a call.
+                Defaults to "auto".
+
+        Returns:
+            int: ID of the compiled callable, or `fid` itself on fallback.
+        """
+        if fid in cls._jit_registry:
+            return cls._jit_registry[fid]
+
+        if mode not in ("numba", "auto"):
+            raise ValueError(f"invalid jit mode: {mode!r}")
+
+        target = cls._callable_registry[fid]
+
+        try:
+            import numba # type: ignore[import-not-found]
+        except ImportError:
+            if mode == "numba":
+                raise
+            return fid
+
+        if not _is_jit_eligible(target):
+            if mode == "numba":
+                raise TypeError(
+                    f"{target!r} is not a top-level function with a fixed "
+                    "signature and cannot be compiled by numba."
+                )
+            return fid
+
+        try:
+            # Raises RuntimeError for functions without a cache locator,
+            # e.g. those defined by exec().
+            compiled = numba.njit(cache=True, nogil=True)(target)
+        except Exception:
+            if mode == "numba":
+                raise
+            return fid
+
+        if mode == "auto":
+            from numba.core.errors import NumbaError # type: ignore[import-not-found]
+            compiled = _JitFallback(compiled, target, (NumbaError,))
+
+        jit_fid = cls.register(compiled)
+        cls._jit_registry[fid] = jit_fid
+        return jit_fid
+
     def submit(
         self,
         source: int | str,
@@ -105,31 +228,49 @@ class Executor:
         """
         raise NotImplementedError
 
-    def cancel(self, task_id: TaskID, /) -> bool:
-        """Cancels the task with the given ID."""
-        raise NotImplementedError
+    def submit_batch(self, tasks: Sequence[TaskSpec], /) -> list[TaskID]:
+        """Submits multiple tasks at once.
 
-    def shutdown(self, wait: bool = True) -> None:
-        """Try cancel all pending work and shutdown the executor."""
-        raise NotImplementedError
+        Executors may override this to amortize synchronization (locks,
+        queue appends, IPC) across the tasks. Defaults to calling `submit`
+        for each task.
 
+        Args:
+            tasks (Sequence of TaskSpec): Tuples of the arguments for `submit`,
+                that is `(source, context, args, kwargs, callback)`.
 
-class ThreadPoolExecutor(Executor):
-    def __init__(self, max_workers: int | None = None) -> None:
-        """A thread pool executor.
+        Returns:
+            list[TaskID]: IDs of the created tasks, in the same order.
+        """
+        submit = self.submit
+        return [submit(*task) for task in tasks]
+
+    def execute(
+        self,
+        source: int | str,
+        context: Context,
+        /,
+        args: tuple[Expr, ...] = (),
+        kwargs: dict[str, Expr] = {}
+    ) -> ExecEvent:
+        """Executes a task synchronously in the calling thread.
+
+        Schedulers may use this to run a task inline instead of handing it
+        over to a worker. Inline tasks have an empty task ID.
 
         Args:
-            max_workers (int | None, optional): Max number of workers.
+            source (int | str): Unique ID of registered callable or source code.
+            context (Context): Necessary memories for expressions to evaluate.
+            args (tuple of Expr): Expressions for positional arguments.
+            kwargs (dict[str, Expr]): Expressions for keyword arguments.
+
+        Returns:
+            ExecEvent: The event of the finished task.
         """
-        from concurrent.futures import ThreadPoolExecutor as _TPE
-        self._executor = _TPE(max_workers)
-        self._futures: dict[TaskID, tuple[Future[None], Future[ExecEvent]]] = {}
+        return self._run(TaskItem(TaskID(""), source, context, args, kwargs))
 
     @staticmethod
-    def _worker(task_item: TaskItem, event_fut: Future[ExecEvent]) -> None:
-        if event_fut.done():
-            return
-
+    def _run(task_item: TaskItem) -> ExecEvent:
         fid = task_item.source
         context = task_item.context
         try:
@@ -145,14 +286,14 @@ class ThreadPoolExecutor(Executor):
             else:
                 raise TypeError(f"invalid type of work item source: {type(fid).__name__}")
 
-            event = ExecEvent(
+            return ExecEvent(
                 task_id=task_item.uid,
                 status=TaskStatus.SUCCESS,
                 value=context.new(result)
             )
         except Exception as e:
             import traceback
-            event = ExecEvent(
+            return ExecEvent(
                 task_id=task_item.uid,
                 status=TaskStatus.FAILED,
                 error_info=ErrorInfo(
@@ -161,6 +302,34 @@ class ThreadPoolExecutor(Executor):
                     traceback.format_exc() if task_item.error_traceback else ""
                 )
             )
+
+    def cancel(self, task_id: TaskID, /) -> bool:
+        """Cancels the task with the given ID."""
+        raise NotImplementedError
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Try cancel all pending work and shutdown the executor."""
+        raise NotImplementedError
+
+
+class ThreadPoolExecutor(Executor):
+    def __init__(self, max_workers: int | None = None) -> None:
+        """A thread pool executor.
+
+        Args:
+            max_workers (int | None, optional): Max number of workers.
+        """
+        from concurrent.futures import ThreadPoolExecutor as _TPE
+        self._executor = _TPE(max_workers)
+        self._futures: dict[TaskID, tuple[Future[None], Future[ExecEvent]]] = {}
+
+    @staticmethod
+    def _worker(task_item: TaskItem, event_fut: Future[ExecEvent]) -> None:
+        if event_fut.done():
+            return
+
+        event = Executor._run(task_item)
+
         if not event_fut.done():
             event_fut.set_result(event)
 
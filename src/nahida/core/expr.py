@@ -2,32 +2,50 @@ from __future__ import annotations
 
 __all__ = [] # NOTE: not allowed to be imported by *
 
-from typing import Any, TypeGuard
+from types import CodeType
+from typing import Any, ClassVar, TypeGuard
 
 from . import errors as _err
 from ._objbase import UIDMixin
 from .context import Context
 
 
-def _to_expr(obj: Any, /) -> Expr:
+# Exact types that are never expressions, checked by identity before falling
+# back to the isinstance() walk.
+_LITERAL_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+
+def ensure_expr(obj: Any, /) -> Expr:
+    """Return the object if it is an expression, otherwise wrap it in a
+    constant expression."""
+    if type(obj) in _LITERAL_TYPES:
+        return ConstExpr(obj)
     if isinstance(obj, Expr):
         return obj
     return ConstExpr(obj)
 
 
+_NO_REFS: frozenset[int] = frozenset()
+
+
 class Expr(UIDMixin):
     """Base class for expressions
 
     Expressions are designed for lightweight data transformations between nodes.
     They are evaluated in a stack-like manner.
     """
+    __slots__ = ()
+    refs_is_empty: ClassVar[bool] = False
+    """True for expression types that never depend on any RefExpr, so that
+    callers may skip `refs()`."""
+
     def eval(self, context: Context, /) -> Any:
         """Evaluate the expression on the given context."""
         raise NotImplementedError()
 
-    def refs(self) -> set[int]:
+    def refs(self) -> frozenset[int]:
         """Return the UIDs of all RefExprs that this expression depends on."""
-        return set()
+        return _NO_REFS
 
     def __call__(self, context: Context, /) -> Any:
         return self.eval(context)
@@ -36,10 +54,10 @@ class Expr(UIDMixin):
         return GetItemExpr(self, index)
 
     def __or__(self, other: Any, /) -> UnionExpr:
-        return UnionExpr(self, _to_expr(other))
+        return UnionExpr(self, ensure_expr(other))
 
     def __ror__(self, other: Any, /) -> UnionExpr:
-        return UnionExpr(_to_expr(other), self)
+        return UnionExpr(ensure_expr(other), self)
 
 
 def is_expr(obj: Any, /) -> TypeGuard[Expr]:
@@ -48,9 +66,33 @@ def is_expr(obj: Any, /) -> TypeGuard[Expr]:
 
 
 class VariableExpr(Expr):
+    """Variable expression that reads the whole value stored under a UID.
+
+    Instances are interned by the target UID, so constructing a variable
+    expression twice returns the same object.
+    """
+    _interned: ClassVar[dict[int, VariableExpr]] = {}
+    _target_uid: int
+    _refs: frozenset[int]
+
+    def __new__(cls, target_uid: int, /) -> VariableExpr:
+        self = cls._interned.get(target_uid)
+
+        if self is None:
+            self = super().__new__(cls)
+            Expr.__init__(self)
+            self._target_uid = target_uid
+            self._refs = frozenset((target_uid,))
+            cls._interned[target_uid] = self
+
+        return self
+
     def __init__(self, target_uid: int, /) -> None:
-        super().__init__()
-        self._target_uid = target_uid
+        pass # initialized once in __new__
+
+    def __getnewargs__(self) -> tuple[int]:
+        # Copies and unpickled objects resolve to the interned instance.
+        return (self._target_uid,)
 
     def __getitem__(self, index: int | str, /) -> VariableGetItemExpr:
         return VariableGetItemExpr(self._target_uid, index)
@@ -61,15 +103,16 @@ class VariableExpr(Expr):
         except KeyError as e:
             raise _err.DataNotFoundError(self._target_uid) from e
 
-    def refs(self) -> set[int]:
-        return {self._target_uid}
+    def refs(self) -> frozenset[int]:
+        return self._refs
 
 
 class VariableGetItemExpr(Expr):
     def __init__(self, target_uid: int, index: Any, /) -> None:
         super().__init__()
         self._target_uid = target_uid
-        self._index = _to_expr(index)
+        self._index = ensure_expr(index)
+        self._refs = frozenset((target_uid,)) | self._index.refs()
 
     def eval(self, context: Context, /) -> Any:
         try:
@@ -78,12 +121,14 @@ class VariableGetItemExpr(Expr):
         except KeyError as e:
             raise _err.DataNotFoundError(self._target_uid) from e
 
-    def refs(self) -> set[int]:
-        return {self._target_uid} | self._index.refs()
+    def refs(self) -> frozenset[int]:
+        return self._refs
 
 
 class ConstExpr[T](Expr):
     """Constant expression that always returns the given value."""
+    refs_is_empty = True
+
     def __init__(self, value: T, /) -> None:
         super().__init__()
         self._value = value
@@ -98,6 +143,8 @@ class RefExpr(Expr):
     Raises *DataNotFoundError* if the UID of this expression does not exist in
     the context.
     """
+    __slots__ = ()
+
     def __getitem__(self, index: int | str, /) -> VariableGetItemExpr:
         return VariableGetItemExpr(self.uid, index)
 
@@ -107,8 +154,8 @@ class RefExpr(Expr):
         except KeyError as e:
             raise _err.DataNotFoundError(self.uid) from e
 
-    def refs(self) -> set[int]:
-        return {self.uid}
+    def refs(self) -> frozenset[int]:
+        return frozenset((self.uid,))
 
 
 class GetItemExpr(Expr):
@@ -120,7 +167,8 @@ class GetItemExpr(Expr):
     def __init__(self, expr: Expr, index: int | str | Expr, /) -> None:
         super().__init__()
         self._expr = expr
-        self._index = _to_expr(index)
+        self._index = ensure_expr(index)
+        self._refs = expr.refs() | self._index.refs()
 
     def eval(self, context: Context, /) -> Any:
         val = self._expr.eval(context)
@@ -133,8 +181,8 @@ class GetItemExpr(Expr):
 
         return val
 
-    def refs(self) -> set[int]:
-        return self._expr.refs() | self._index.refs()
+    def refs(self) -> frozenset[int]:
+        return self._refs
 
 
 class UnionExpr(Expr):
@@ -153,6 +201,8 @@ class UnionExpr(Expr):
             else:
                 self._exprs.append(expr)
 
+        self._refs = frozenset().union(*(expr.refs() for expr in self._exprs))
+
     def eval(self, context: Context, /) -> Any:
         for expr in self._exprs:
             try:
@@ -166,13 +216,26 @@ class UnionExpr(Expr):
 
         raise _err.UnionError()
 
-    def refs(self) -> set[int]:
-        result: set[int] = set()
+    def refs(self) -> frozenset[int]:
+        return self._refs
 
-        for expr in self._exprs:
-            result |= expr.refs()
 
-        return result
+_FORMULA_CACHE: dict[str, CodeType] = {}
+_FORMULA_GLOBALS: dict[str, Any] = {}
+
+
+def _formula_globals() -> dict[str, Any]:
+    """Return the globals shared by formulas: the builtins and the math
+    module, without the import machinery."""
+    if not _FORMULA_GLOBALS:
+        import builtins, math
+        save_builtins = vars(builtins).copy()
+        save_builtins.update(vars(math))
+        save_builtins.pop("__import__", None)
+        save_builtins.pop("__loader__", None)
+        _FORMULA_GLOBALS["__builtins__"] = save_builtins
+
+    return _FORMULA_GLOBALS
 
 
 class FormulaExpr(Expr):
@@ -185,16 +248,18 @@ class FormulaExpr(Expr):
         **attributes (dict[str, Expr]): values for variables in the source.
     """
     def __init__(self, source: str, /, **locals: Expr) -> None:
-        save_builtins = dict(__builtins__).copy()
-        save_builtins.update(vars(__import__("math")))
-        save_builtins.pop("__import__", None)
-        save_builtins.pop("__loader__", None)
+        super().__init__()
+        code = _FORMULA_CACHE.get(source)
+
+        if code is None:
+            code = compile(source, "<formula>", "eval")
+            _FORMULA_CACHE[source] = code
 
+        globals_ = _formula_globals()
         self._source = source
-        self._func = lambda **kwargs: eval(
-            source, {"__builtins__": save_builtins}, kwargs
-        )
+        self._func = lambda **kwargs: eval(code, globals_, kwargs)
         self._locals = locals
+        self._refs = frozenset().union(*(loc.refs() for loc in locals.values()))
 
     def eval(self, context: Context, /) -> Any:
         local_vars = {name: value.eval(context) for name, value in self._locals.items()}
@@ -203,13 +268,8 @@ class FormulaExpr(Expr):
         except Exception as e:
             raise _err.ExprEvalError() from e
 
-    def refs(self) -> set[int]:
-        result: set[int] = set()
-
-        for loc in self._locals.values():
-            result |= loc.refs()
-
-        return result
+    def refs(self) -> frozenset[int]:
+        return self._refs
 
 
 class FunctionExpr(Expr):
@@ -218,9 +278,14 @@ class FunctionExpr(Expr):
     Raises *ExprEvalError* when the evaluation failed.
     """
     def __init__(self, fid: int, /, *args: Expr, **kwargs: Expr) -> None:
+        super().__init__()
         self._fid = fid
-        self._args = args
-        self._kwargs = kwargs
+        self._args = tuple(map(ensure_expr, args))
+        self._kwargs = {name: ensure_expr(value) for name, value in kwargs.items()}
+        self._refs = frozenset().union(
+            *(arg.refs() for arg in self._args),
+            *(kwarg.refs() for kwarg in self._kwargs.values())
+        )
 
     def eval(self, context: Context, /) -> Any:
         local_args = [arg.eval(context) for arg in self._args]
@@ -232,13 +297,5 @@ class FunctionExpr(Expr):
         except Exception as e:
             raise _err.ExprEvalError() from e
 
-    def refs(self) -> set[int]:
-        result: set[int] = set()
-
-        for arg in self._args:
-            result |= arg.refs()
-
-        for kwarg in self._kwargs.values():
-            result |= kwarg.refs()
-
-        return result
+    def refs(self) -> frozenset[int]:
+        return self._refs
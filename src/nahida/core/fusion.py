@@ -0,0 +1,204 @@
+# nahida/core/fusion.py
+
+__all__ = ["fuse_linear_chains"]
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from . import _objbase as _ob
+from . import node as _node
+from .executor import Executor
+from .graph import Graph
+
+
+class _Composed:
+    """Callable passing the result of each stage to the next one as its only
+    argument, by position if the key of the stage is None or by keyword
+    otherwise. Stages run in a loop, so that long chains do not nest calls."""
+    __slots__ = ("__name__", "_first", "_stages")
+
+    def __init__(
+        self,
+        first: Callable[..., Any],
+        stages: list[tuple[Callable[..., Any], str | None]]
+    ) -> None:
+        self._first = first
+        self._stages = stages
+        self.__name__ = "__".join(
+            getattr(fn, "__name__", "fn") for fn in (first, *(f for f, _ in stages))
+        )
+
+    @classmethod
+    def chain(
+        cls,
+        first: Callable[..., Any],
+        nexts: Iterable[tuple[Callable[..., Any], str | None]]
+    ) -> "_Composed":
+        """Compose the callables, flattening those already composed."""
+        if isinstance(first, _Composed):
+            stages = list(first._stages)
+            first = first._first
+        else:
+            stages = []
+
+        for fn, key in nexts:
+            if isinstance(fn, _Composed):
+                stages.append((fn._first, key))
+                stages.extend(fn._stages)
+            else:
+                stages.append((fn, key))
+
+        return cls(first, stages)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        value = self._first(*args, **kwargs)
+        for fn, key in self._stages:
+            value = fn(value) if key is None else fn(**{key: value})
+        return value
+
+
+def _recruiters(node: _node.Node) -> tuple[_node._Recruiter, ...]:
+    if isinstance(node, _node._Recruiter):
+        return (node,)
+    if isinstance(node, _node.Branch):
+        return (node.true, node.false)
+    if isinstance(node, _node.Repeat):
+        return (node.iter, node.stop)
+    return ()
+
+
+def _successors(node: _node.Node) -> Iterable[_node.Node]:
+    for rec in _recruiters(node):
+        for uid in rec.downstreams:
+            yield _ob.get_entity(uid, _node.Node)
+    if isinstance(node, _node.Join.Receiver):
+        yield node.parent
+
+
+def _collect_nodes(starters: Iterable[_node.Node]) -> dict[int, _node.Node]:
+    nodes: dict[int, _node.Node] = {}
+    stack = list(starters)
+
+    while stack:
+        node = stack.pop()
+        if node.uid in nodes:
+            continue
+        nodes[node.uid] = node
+        stack.extend(_successors(node))
+
+    return nodes
+
+
+def _exposed_refs(graph: Graph) -> set[int]:
+    exposes = graph._expose
+    if exposes is None:
+        return set()
+    if isinstance(exposes, tuple):
+        exprs = exposes
+    elif isinstance(exposes, dict):
+        exprs = tuple(exposes.values())
+    else:
+        exprs = (exposes,)
+
+    uid_set: set[int] = set()
+    for expr in exprs:
+        uid_set |= expr.refs()
+    return uid_set
+
+
+def _single_subscription(node: _node.Execute) -> tuple[Any, str | None] | None:
+    """Return the only subscribed expression of the node and its keyword
+    (None for positional), or None if the node has not exactly one."""
+    if node.numattr() != 1:
+        return None
+    if node.numattr("P") == 1:
+        return node._args[0], None
+    key = next(iter(node.keywords()))
+    return node._kwargs[key], key
+
+
+def fuse_linear_chains(graph: Graph, /) -> int:
+    """Fuse straight-line chains of `Execute` nodes in the graph.
+
+    A node A is fused into its downstream B when A recruits only B, B is
+    recruited only by A, and B subscribes to nothing but the output of A,
+    which is not read by any other node or exposed by the graph. B then
+    calls the composition of both callables with the subscriptions of A,
+    saving one scheduling round-trip per fused pair. The graph is modified
+    in place; call this before `lambdify` or `group`.
+
+    Nodes outside the graph referring to A are not visible to this pass.
+
+    Args:
+        graph (Graph): The graph to optimize.
+
+    Returns:
+        int: The number of nodes removed.
+    """
+    nodes = _collect_nodes(graph._starters)
+    starter_uids = {n.uid for n in graph._starters}
+    linkers: dict[int, list[_node._Recruiter]] = {}
+    readers: dict[int, int] = {}
+
+    for node in nodes.values():
+        for rec in _recruiters(node):
+            for uid in rec.downstreams:
+                linkers.setdefault(uid, []).append(rec)
+        if isinstance(node, _node._ContextReader):
+            for uid in node.deps():
+                readers[uid] = readers.get(uid, 0) + 1
+    exposed = _exposed_refs(graph)
+
+    # Map each fusable node A to its downstream B, with the keyword of B.
+    nexts: dict[int, tuple[_node.Execute, str | None]] = {}
+    fusables: dict[int, _node.Execute] = {}
+
+    for a in nodes.values():
+        if type(a) is not _node.Execute or len(a.downstreams) != 1:
+            continue
+        b = nodes[next(iter(a.downstreams))]
+        if b is a or type(b) is not _node.Execute or b.uid in starter_uids:
+            continue
+        if len(linkers.get(b.uid, ())) != 1:
+            continue
+        if readers.get(a.uid, 0) != 1 or a.uid in exposed:
+            continue
+        single = _single_subscription(b)
+        if single is None or single[0] is not a:
+            continue
+        if not (isinstance(a._source, int) and isinstance(b._source, int)):
+            continue
+        nexts[a.uid] = (b, single[1])
+        fusables[a.uid] = a
+
+    # Rewrite each maximal chain once, starting from nodes fused into nothing.
+    # Chains closing a loop have no such head and are left as they are.
+    for b, _ in nexts.values():
+        fusables.pop(b.uid, None)
+    registry = Executor._callable_registry
+    fused = 0
+
+    for head in fusables.values():
+        stages: list[tuple[Callable[..., Any], str | None]] = []
+        tail = head
+
+        while tail.uid in nexts:
+            tail, key = nexts[tail.uid]
+            stages.append((registry[tail._source], key)) # type: ignore[index]
+
+        tail._source = Executor.register(
+            _Composed.chain(registry[head._source], stages) # type: ignore[index]
+        )
+        tail._args = list(head._args)
+        tail._kwargs = dict(head._kwargs)
+        tail._deps = None
+
+        for rec in linkers.get(head.uid, ()):
+            rec.unlinkuid(head.uid)
+            rec.linkuid(tail.uid)
+        if head.uid in starter_uids:
+            graph._starters = [tail if n is head else n for n in graph._starters]
+
+        fused += len(stages)
+
+    return fused
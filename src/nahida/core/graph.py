@@ -25,28 +25,41 @@ class Graph(_ob.NameMixin, _ob.UIDMixin):
     """General computational node graph."""
     def __init__(
         self,
-        starters: Sequence[_node.Node],
+        starters: _node.Node | Sequence[_node.Node],
         exposes: Expr | tuple[Expr, ...] | dict[str, Expr] | None = None,
         *,
         uid: int | None = None
     ):
         """
         Args:
-            starters (Iterable of Node): The root nodes for execution.
+            starters (Node | Iterable of Node): The root node(s) for execution.
             exposes (Node, Expr, tuple, dict): Subscribed for outputs.
         """
         _ob.UIDMixin.__init__(self, uid=uid)
+        if isinstance(starters, _node.Node):
+            starters = (starters,)
         self._starters = starters
-        self._expose: Expr | tuple[Expr, ...] | dict[str, Expr] | None = None
+        self._expose = self._validate_exposes(exposes)
+        self._construct_output = self._build_exposer(self._expose)
 
-        if exposes is None:
-            return
-        elif isinstance(exposes, Expr):
-            self._expose = exposes
+    def _validate_port(self, port: Expr) -> Expr:
+        if _expr.is_expr(port):
+            return port
+        else:
+            raise TypeError(
+                f"expected expressions, got {type(port).__name__!r}."
+            )
+
+    def _validate_exposes(
+        self,
+        exposes: Expr | tuple[Expr, ...] | dict[str, Expr] | None
+    ) -> Expr | tuple[Expr, ...] | dict[str, Expr] | None:
+        if exposes is None or isinstance(exposes, Expr):
+            return exposes
         elif isinstance(exposes, tuple):
-            self._expose = tuple(map(self._validate_port, exposes))
+            return tuple(map(self._validate_port, exposes))
         elif isinstance(exposes, dict):
-            self._expose = {
+            return {
                 key: self._validate_port(value)
                 for key, value in exposes.items()
             }
@@ -56,16 +69,6 @@ class Graph(_ob.NameMixin, _ob.UIDMixin):
                 f"got {type(exposes).__name__!r}."
             )
 
-        self._construct_output = self._build_exposer(exposes)
-
-    def _validate_port(self, port: Expr) -> Expr:
-        if _expr.is_expr(port):
-            return port
-        else:
-            raise TypeError(
-                f"expected expressions, got {type(port).__name__!r}."
-            )
-
     def _read_context(self, context: Context, expr: Expr, expose_item: Any = None):
         try:
             val = expr.eval(context)
@@ -78,49 +81,37 @@ class Graph(_ob.NameMixin, _ob.UIDMixin):
         self,
         exposes: Expr | tuple[Expr, ...] | dict[str, Expr] | None
     ) -> Callable[[Context], Any]:
+        """Build the output constructor for validated exposes."""
         if exposes is None:
             def _output_constructor(context): # type: ignore
                 return None
-            return _output_constructor
 
         elif isinstance(exposes, Expr):
-            exposed_exprs = exposes
             def _output_constructor(context): # type: ignore
                 return self._read_context(context, exposes)
-            return _output_constructor
 
         elif isinstance(exposes, tuple):
-            exposed_exprs = tuple(map(self._validate_port, exposes))
             def _output_constructor(context): # type: ignore
                 return tuple(
                     self._read_context(context, expr, index)
-                    for index, expr in enumerate(exposed_exprs)
+                    for index, expr in enumerate(exposes)
                 )
-            return _output_constructor
 
-        elif isinstance(exposes, dict):
-            exposed_exprs = {
-                key: self._validate_port(value)
-                for key, value in exposes.items()
-            }
+        else:
             def _output_constructor(context):
                 return {
                     key: self._read_context(context, value, key)
-                    for key, value in exposed_exprs.items()
+                    for key, value in exposes.items()
                 }
-            return _output_constructor
 
-        else:
-            raise TypeError(
-                "expected expressions, tuple, dict, or None, "
-                f"got {type(exposes).__name__!r}."
-            )
+        return _output_constructor
 
     def lambdify(
         self,
         *,
         scheduler: Scheduler | None = None,
-        executor: Executor | None = None
+        executor: Executor | None = None,
+        cache: bool | int = False
     ):
         """Transform the graph to a lambda function.
 
@@ -131,6 +122,11 @@ class Graph(_ob.NameMixin, _ob.UIDMixin):
             executor (Executor, optional): The executor running the works
                 submitted by the scheduler.
                 Defaults to `None`, using the global default.
+            cache (bool | int, optional): Memoize outputs by the call
+                arguments, for pure graphs. Calls with unhashable arguments
+                are not cached. A positive int sets the max number of entries,
+                `True` means 128, and `0` disables caching. The least recently
+                used entry is dropped first. Defaults to `False`.
 
         Returns:
             Callable: The lambda function.
@@ -140,22 +136,21 @@ class Graph(_ob.NameMixin, _ob.UIDMixin):
         if executor is None:
             raise NotImplementedError
 
-        def runner(*args, **kwargs):
-            context = Context()
-            if args or kwargs:
-                initial: dict[int | str, Any] = {}
-                initial.update(enumerate(args))
-                initial.update(kwargs)
-                context[self.uid] = context.new(initial)
-
-            context = scheduler.forward(
-                context,
-                [n.activate for n in self._starters],
-                executor=executor
+        if isinstance(cache, bool):
+            maxsize = 128 if cache else 0
+        elif isinstance(cache, int):
+            if cache < 0:
+                raise ValueError(f"cache size must be non-negative, got {cache}.")
+            maxsize = cache
+        else:
+            raise TypeError(
+                f"expected bool or int for cache, got {type(cache).__name__!r}."
             )
-            return self._construct_output(context)
 
-        return runner
+        if maxsize == 0:
+            return _Lambdified(self, scheduler, executor)
+
+        return _CachedLambdified(self, scheduler, executor, maxsize)
 
     def group(self, *, uid: int | None = None) -> _node.Group:
         """Create a new Group node wrapping this graph."""
@@ -171,6 +166,64 @@ class Graph(_ob.NameMixin, _ob.UIDMixin):
         return _expr.VariableExpr(self.uid)
 
 
+class _Lambdified:
+    """Callable running a graph with the given scheduler and executor."""
+    __slots__ = ("graph", "scheduler", "executor")
+
+    def __init__(self, graph: Graph, scheduler: Scheduler, executor: Executor) -> None:
+        self.graph = graph
+        self.scheduler = scheduler
+        self.executor = executor
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        graph = self.graph
+        context = Context()
+        if args or kwargs:
+            initial: dict[int | str, Any] = {}
+            initial.update(enumerate(args))
+            initial.update(kwargs)
+            context[graph.uid] = context.new(initial)
+
+        context = self.scheduler.forward(
+            context,
+            [n.activate for n in graph._starters],
+            executor=self.executor
+        )
+        return graph._construct_output(context)
+
+
+class _CachedLambdified(_Lambdified):
+    """`_Lambdified` memoizing at most `maxsize` outputs by the call arguments,
+    dropping the least recently used entry first."""
+    __slots__ = ("maxsize", "results")
+
+    def __init__(
+        self,
+        graph: Graph,
+        scheduler: Scheduler,
+        executor: Executor,
+        maxsize: int
+    ) -> None:
+        super().__init__(graph, scheduler, executor)
+        self.maxsize = maxsize
+        self.results: dict[Any, Any] = {}
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        results = self.results
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+            result = results.pop(key)
+        except TypeError: # unhashable arguments
+            return _Lambdified.__call__(self, *args, **kwargs)
+        except KeyError:
+            result = _Lambdified.__call__(self, *args, **kwargs)
+            if len(results) >= self.maxsize:
+                del results[next(iter(results))]
+
+        results[key] = result
+        return result
+
+
 class GraphThread(Thread):
     def __init__(
         self,
@@ -18,12 +18,18 @@ from typing import Any, overload, Literal
 from . import _objbase
 from . import context as _ctx
 from . import errors as _err
+from . import executor as _exe
 from . import expr as _expr
 from . import scheduler as _sch
 
 
 type Expr = _expr.Expr
 
+# Shared orders for activations that recruit nothing. Schedulers read neither
+# the uid nor the context of an order without source and recruitments.
+_IDLE_ORDER = _sch.OrderItem(0)
+_EXIT_ORDER = _sch.OrderItem(0, control=_sch.FlowControl.EXIT)
+
 
 class Node(_objbase.NameMixin, _expr.RefExpr):
     """Abstract base class for all nodes.
@@ -38,8 +44,11 @@ class Node(_objbase.NameMixin, _expr.RefExpr):
     Here `context` is a dictionary of node IDs to the
     corresponding output values.
     """
+    __slots__ = ("_uname",)
+
     def __init__(self, *, uid: int | None = None) -> None:
         _expr.Expr.__init__(self, uid=uid)
+        self._uname = None
 
     def activate(self, context: _ctx.Context) -> _sch.Coroutine:
         """Return a task to be submitted to the task queue.
@@ -67,13 +76,15 @@ class _ContextReader:
     """Supports read_context in a node.
 
     Introduce `_values` and `_connects` dicts for defaults and subscriptions.
+    Subclasses should declare `_args` and `_kwargs` in their `__slots__`.
     """
+    __slots__ = ()
     _args: list[Expr]
     _kwargs: dict[str, Expr]
 
     def __init__(self) -> None:
-        self._args = []
-        self._kwargs = {}
+        self._args = [] # type: ignore[misc] # slot declared by subclasses
+        self._kwargs = {} # type: ignore[misc] # slot declared by subclasses
 
     def subs(self, *args: Expr | Any, **kwargs: Expr | Any) -> None:
         """Set subscriptions for attributes.
@@ -87,13 +98,10 @@ class _ContextReader:
             *args (Expr | Any): Sources for positional attributes.
             **kwargs (Expr | Any): The attribute-source pairs.
         """
-        self._args.extend(
-            item if _expr.is_expr(item) else _expr.ConstExpr(item)
-            for item in args
-        )
+        ensure_expr = _expr.ensure_expr
+        self._args.extend(map(ensure_expr, args))
         self._kwargs.update(
-            {name: item if _expr.is_expr(item) else _expr.ConstExpr(item)
-             for name, item in kwargs.items()}
+            {name: ensure_expr(item) for name, item in kwargs.items()}
         )
 
     def unsubs(self, *attrs: int | str) -> None:
@@ -157,22 +165,30 @@ class _ContextReader:
 
     def read_context_all_subscriptions(self, context: _ctx.Context, /):
         """Get values for all subscribed attributes on the given context."""
-        args: list[Any] = []
-        kwargs: dict[str, Any] = {}
+        items = self.read_context_all_items(context)
+        args = tuple(items.pop(index) for index in range(len(self._args)))
+        kwargs: dict[str, Any] = items # type: ignore[assignment] # only keywords left
+
+        return args, kwargs
+
+    def read_context_all_items(self, context: _ctx.Context, /) -> dict[int | str, Any]:
+        """Get values for all subscribed attributes on the given context, as
+        a dict keyed by the position or keyword of the attributes."""
+        items: dict[int | str, Any] = {}
 
         for index, expr in enumerate(self._args):
             try:
-                args.append(expr.eval(context))
+                items[index] = expr.eval(context)
             except Exception as e:
                 raise _err.SubscribeError(self, index) from e
 
         for key, expr in self._kwargs.items():
             try:
-                kwargs[key] = expr.eval(context)
+                items[key] = expr.eval(context)
             except Exception as e:
                 raise _err.SubscribeError(self, key) from e
 
-        return tuple(args), kwargs
+        return items
 
 
 class _Recruiter:
@@ -180,14 +196,16 @@ class _Recruiter:
 
     Introduce `_downstreams` list for downstream nodes.
     `link` and `unlink` are available for manage downstream nodes.
+    Subclasses should declare `_downstreams` in their `__slots__`.
     """
+    __slots__ = ()
     _downstreams: set[int]
 
     def __init__(self, downstream: set[int] | None = None, /):
         if downstream is None:
-            self._downstreams = set()
+            self._downstreams = set() # type: ignore[misc] # slot declared by subclasses
         else:
-            self._downstreams = set(downstream)
+            self._downstreams = set(downstream) # type: ignore[misc] # slot declared by subclasses
 
     def link(self, *other: Node) -> None:
         """Add downstream nodes to be recruited after execution.
@@ -232,34 +250,72 @@ class _Recruiter:
         return self._downstreams
 
 
+class _Downstreams(_Recruiter):
+    """Standalone downstream set, used for the branches of control nodes."""
+    __slots__ = ("_downstreams",)
+
+
 class Execute(_Recruiter, _ContextReader, Node):
-    """Computational Node object."""
+    """Computational Node object.
+
+    Args:
+        source (int | str): ID of the registered callable, or source code.
+        jit ("numba" | "auto" | None, optional): Compile the registered
+            callable with numba once at construction, see `Executor.jit`.
+            Ignored for source code. Defaults to `None`.
+    """
+    __slots__ = ("_downstreams", "_args", "_kwargs", "_source", "_deps")
     _source: int | str
+    _deps: frozenset[int] | None
 
-    def __init__(self, source: int | str, /, *, uid: Any = None):
+    def __init__(
+        self,
+        source: int | str,
+        /, *,
+        jit: _exe.JitMode | None = None,
+        uid: Any = None
+    ):
         Node.__init__(self, uid=uid)
         _ContextReader.__init__(self)
         _Recruiter.__init__(self)
+        if jit is not None and isinstance(source, int):
+            source = _exe.Executor.jit(source, jit)
         self._source = source
+        self._deps = None
+
+    def subs(self, *args: Expr | Any, **kwargs: Expr | Any) -> None:
+        _ContextReader.subs(self, *args, **kwargs)
+        self._deps = None
+
+    def unsubs(self, *attrs: int | str) -> None:
+        _ContextReader.unsubs(self, *attrs)
+        self._deps = None
 
     def activate(self, context: _ctx.Context):
+        # Subscriptions rarely change between activations.
+        if self._deps is None:
+            self._deps = frozenset(self.deps())
+
         yield _sch.OrderItem(
             self.uid,
             context=context,
             source=self._source,
             args=tuple(self._args),
             kwargs=self._kwargs,
-            recruit=self.downstream_activates()
+            recruit=self.downstream_activates(),
+            deps=self._deps
         )
 
 
 class Branch(_ContextReader, Node):
     """Branch the execution based on a condition."""
+    __slots__ = ("_args", "_kwargs", "_downstreams_true", "_downstreams_false")
+
     def __init__(self, condition: Expr | bool | None = None, /, *, uid: int | None = None) -> None:
         Node.__init__(self, uid=uid)
         _ContextReader.__init__(self)
-        self._downstreams_true = _Recruiter()
-        self._downstreams_false = _Recruiter()
+        self._downstreams_true = _Downstreams()
+        self._downstreams_false = _Downstreams()
         if condition is not None:
             self.subs(condition)
 
@@ -275,20 +331,23 @@ class Branch(_ContextReader, Node):
 
     def activate(self, context: _ctx.Context):
         val, status = self.read_context(context, 0)
+        branch = self.true if (bool(val) and status) else self.false
 
-        if bool(val) and status:
-            yield _sch.OrderItem(self.uid, context=context, recruit=self.true.downstream_activates())
+        if branch.downstreams:
+            yield _sch.OrderItem(self.uid, context=context, recruit=branch.downstream_activates())
         else:
-            yield _sch.OrderItem(self.uid, context=context, recruit=self.false.downstream_activates())
+            yield _IDLE_ORDER
 
 
 class Repeat(_ContextReader, Node):
     """Repeat the execution for multiple times."""
+    __slots__ = ("_args", "_kwargs", "_downstreams_iter", "_downstreams_stop")
+
     def __init__(self, iterable: Expr | Iterable[Any] | None = None, *, uid: int | None = None) -> None:
         Node.__init__(self, uid=uid)
         _ContextReader.__init__(self)
-        self._downstreams_iter = _Recruiter()
-        self._downstreams_stop = _Recruiter()
+        self._downstreams_iter = _Downstreams()
+        self._downstreams_stop = _Downstreams()
         if iterable is not None:
             self.subs(iterable)
 
@@ -304,12 +363,15 @@ class Repeat(_ContextReader, Node):
 
     def activate(self, context: _ctx.Context):
         iterable = self.read_context(context, 0)[0]
+        uid = self.uid
+        new = context.new
+        recruit = self.iter.downstream_activates()
         for current in iterable:
-            context[self.uid] = context.new((current,))
+            context[uid] = new((current,))
             yield _sch.OrderItem(
-                self.uid,
+                uid,
                 context=context,
-                recruit=self.iter.downstream_activates(),
+                recruit=recruit,
                 control=_sch.FlowControl.AWAIT
             )
         yield _sch.OrderItem(
@@ -341,7 +403,17 @@ class Repeat(_ContextReader, Node):
 
 class Break(_Recruiter, Node):
     """Break the repeat loop."""
+    __slots__ = ("_downstreams",)
+
+    def __init__(self, *, uid: int | None = None) -> None:
+        Node.__init__(self, uid=uid)
+        _Recruiter.__init__(self)
+
     def activate(self, context: _ctx.Context):
+        if not self.downstreams:
+            yield _EXIT_ORDER
+            return
+
         yield _sch.OrderItem(
             self.uid,
             context=context,
@@ -352,36 +424,45 @@ class Break(_Recruiter, Node):
 
 class Join(_Recruiter, Node):
     """Block the execution until all receivers are triggered."""
+    __slots__ = ("_downstreams", "receivers", "_mask", "_all_set")
+
     def __init__(self, num: int = 2, *, uid: Any = None):
         Node.__init__(self, uid=uid)
         _Recruiter.__init__(self)
         self.receivers = tuple(Join.Receiver(self, i) for i in range(num))
-        self.flags = [False] * num
+        self._mask = 0
+        self._all_set = (1 << num) - 1
 
     def activate(self, context: _ctx.Context):
-        if all(self.flags):
-            self.flags = [False] * len(self.receivers)
+        if self._mask == self._all_set:
+            self._mask = 0
             yield _sch.OrderItem(self.uid, context=context, recruit=self.downstream_activates())
         else:
-            yield _sch.OrderItem(self.uid)
+            yield _IDLE_ORDER
 
     class Receiver(Node):
+        __slots__ = ("parent", "index", "_bit", "_recruit")
+
         def __init__(self, parent: Join, index: int):
             super().__init__()
             self.parent = parent
             self.index = index
+            self._bit = 1 << index
+            self._recruit = (parent.activate,)
 
         def activate(self, context: _ctx.Context):
-            self.parent.flags[self.index] = True
+            self.parent._mask |= self._bit
             yield _sch.OrderItem(
                 self.uid,
                 context=context,
-                recruit={self.parent.activate,}
+                recruit=self._recruit
             )
 
 
 class Group(_Recruiter, _ContextReader, Node):
     """Schedule a group of nodes with a sub-context."""
+    __slots__ = ("_downstreams", "_args", "_kwargs", "_guid", "_entries", "_extractor")
+
     def __init__(
         self,
         guid: int,
@@ -398,13 +479,10 @@ class Group(_Recruiter, _ContextReader, Node):
         self._extractor = extractor
 
     def activate(self, context: _ctx.Context) -> _sch.Generator[_sch.OrderItem, Any, Any]:
-        args, kwargs = self.read_context_all_subscriptions(context)
+        initial = self.read_context_all_items(context)
         sub_context = _ctx.Context()
 
-        if args or kwargs:
-            initial: dict[int | str, Any] = {}
-            initial.update(enumerate(args))
-            initial.update(kwargs)
+        if initial:
             sub_context[self._guid] = sub_context.new(initial)
 
         yield _sch.OrderItem(
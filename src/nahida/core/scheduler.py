@@ -8,30 +8,32 @@ __all__ = [
 ]
 
 from collections import deque
-from collections.abc import Collection, Callable, Generator
+from collections.abc import Collection, Callable, Generator, MutableSequence
 from dataclasses import dataclass, field
-from enum import StrEnum
-from queue import SimpleQueue
+from enum import IntEnum
+from itertools import chain, repeat
+from queue import Empty, SimpleQueue
 from typing import Sequence, Any
 
+from ._scheduler_core import ScopeManager
 from .context import Context
-from .executor import TaskID, Executor, ExecEvent
+from .executor import Executor, ExecEvent, TaskSpec
 from .expr import Expr
 
 
-class FlowControl(StrEnum):
+class FlowControl(IntEnum):
     """Workflow control instruction after execution."""
 
-    NONE = "none"
+    NONE = 0
     """**NONE**: *Only one-shot. Do and then remove this coroutine.*"""
 
-    AWAIT = "await"
+    AWAIT = 1
     """**AWAIT**: *Wait for all the recruited coroutines to complete.*
 
     Create a new scope for downstreams. Recall this coroutine
     when the new scope exhausts naturely."""
 
-    EXIT = "exit"
+    EXIT = 2
     """**EXIT**: *Only one-shot. Try canceling the most recent upstream
     coroutine that is awaiting and all its recruitments.*
 
@@ -56,6 +58,9 @@ class OrderItem:
             to be recruited into the event loop.
         control (FlowControl, optional): Workflow control instruction **after**
             execution. Defaults to `none`.
+        deps (frozenset[int], optional): The UIDs that the args and kwargs
+            depend on, for nodes caching them across activations. Collected
+            from the args and kwargs for orders with a source if not given.
     """
     uid: int
     context: Context = field(default_factory=Context)
@@ -64,67 +69,101 @@ class OrderItem:
     kwargs: dict[str, Expr] = field(default_factory=dict)
     recruit: Collection[CoroutineFunc] | None = None
     control: FlowControl = FlowControl.NONE
+    deps: frozenset[int] | None = field(default=None, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        if self.source is None or self.deps is not None:
+            return
 
-@dataclass(slots=True)
-class NodeScope:
-    count: int = 1
-    recall: Coroutine | None = None
-    back_id: int | None = None
-    cancelled: bool = False
-
-
-class ScopeManager:
-    _scope_count: int
-    scope_table: dict[int, NodeScope]
-
-    def __init__(self, num_starters: int) -> None:
-        self._scope_count = 1
-        self.scope_table: dict[int, NodeScope] = {0: NodeScope(num_starters)}
-
-    def __contains__(self, item: int) -> bool:
-        return item in self.scope_table
-
-    def __getitem__(self, item: int) -> NodeScope:
-        try:
-            return self.scope_table[item]
-        except KeyError:
-            raise KeyError(f"invalid scope id {item}")
-
-    def create_scope(self, back_id: int, recall: Coroutine) -> int:
-        new_id = self._scope_count
-        new_scope = NodeScope(0, recall, back_id)
-        self.scope_table[new_id] = new_scope
-        self._scope_count += 1
-        return new_id
-
-    def on_node_complete(self, scope_id: int) -> None:
-        self[scope_id].count -= 1
-
-    def on_recruit(self, scope_id: int, n: int) -> None:
-        self[scope_id].count += n
-
-    def cancel_scope(self, scope_id: int) -> int:
-        self[scope_id].cancelled = True
-        back_id = self[scope_id].back_id
-        if back_id is None:
-            raise RuntimeError("cannot cancel the root scope as "
-                               "no back scope found")
-        return back_id
-
-    def check_scope_done(self, scope_id: int) -> bool:
-        if scope_id not in self.scope_table:
-            return False
-
-        scope = self.scope_table[scope_id]
-        return scope.count < 1 or scope.cancelled == True
-
-    def get_recall(self, scope_id: int) -> tuple[Coroutine, int] | None:
-        scope = self[scope_id]
-
-        if scope.recall is not None:
-            assert scope.back_id is not None, "back_id cannot be None if recall was specified"
-            return scope.recall, scope.back_id
+        uid_set: set[int] = set()
+        for expr in chain(self.args, self.kwargs.values()):
+            if not expr.refs_is_empty:
+                uid_set |= expr.refs()
+        object.__setattr__(self, "deps", frozenset(uid_set))
+
+
+def _on_none(scope_manager: ScopeManager, coro: Coroutine, scope_id: int) -> int:
+    scope_manager.on_node_complete(scope_id)
+    return scope_id
+
+
+def _on_await(scope_manager: ScopeManager, coro: Coroutine, scope_id: int) -> int:
+    return scope_manager.create_scope(scope_id, coro)
+
+
+def _on_exit(scope_manager: ScopeManager, coro: Coroutine, scope_id: int) -> int:
+    return scope_manager.cancel_scope(scope_id)
+
+
+# Returns the scope that the recruited coroutines belong to.
+_CONTROL_DISPATCH: dict[FlowControl, Callable[[ScopeManager, Coroutine, int], int]] = {
+    FlowControl.NONE: _on_none,
+    FlowControl.AWAIT: _on_await,
+    FlowControl.EXIT: _on_exit,
+}
+
+
+def _finish_task(
+    event: ExecEvent,
+    coro: Coroutine,
+    ready_coros: MutableSequence[Coroutine],
+    ready_scopes: MutableSequence[int],
+    scope_manager: ScopeManager,
+    order_item: OrderItem,
+    scope_id: int
+) -> None:
+    if event.is_success():
+        if event.value is not None:
+            order_item.context[order_item.uid] = event.value
+        _recruit_and_recall(
+            coro, ready_coros, ready_scopes, scope_manager, order_item, scope_id
+        )
+        return
+
+    scope_manager.on_node_complete(scope_id)
+
+    if scope_manager.done[scope_id]:
+        recall_and_back_id = scope_manager.get_recall(scope_id)
+        if recall_and_back_id:
+            ready_coros.append(recall_and_back_id[0])
+            ready_scopes.append(recall_and_back_id[1])
+
+
+def _recruit_and_recall(
+    coro: Coroutine,
+    ready_coros: MutableSequence[Coroutine],
+    ready_scopes: MutableSequence[int],
+    scope_manager: ScopeManager,
+    order_item: OrderItem,
+    scope_id: int
+) -> None:
+    done = scope_manager.done
+
+    # If already been cancelled by other nodes, do nothing
+    if done[scope_id]:
+        return
+
+    try:
+        on_control = _CONTROL_DISPATCH[order_item.control]
+    except KeyError:
+        raise ValueError(f"Invalid control flow: {order_item.control!r}") from None
+
+    scope_id = on_control(scope_manager, coro, scope_id)
+
+    recruit = order_item.recruit
+    if recruit:
+        num = len(recruit)
+        scope_manager.on_recruit(scope_id, num)
+        context = order_item.context
+        ready_coros.extend(nxt(context) for nxt in recruit)
+        ready_scopes.extend(repeat(scope_id, num))
+
+    # Leaf nodes completing inside an open scope stop here.
+    if done[scope_id]:
+        recall_and_back_id = scope_manager.get_recall(scope_id)
+        if recall_and_back_id:
+            ready_coros.append(recall_and_back_id[0])
+            ready_scopes.append(recall_and_back_id[1])
 
 
 class Scheduler:
@@ -141,112 +180,142 @@ class Scheduler:
 
 
 class ConcurrentScheduler(Scheduler):
-    def __init__(self, max_inflight: int = 1000) -> None:
+    def __init__(
+        self,
+        max_inflight: int = 1000,
+        *,
+        fifo: bool = False,
+        inline_when_saturated: bool = True
+    ) -> None:
         """A concurrent scheduler.
 
         Args:
             max_inflight (int): maximum number of tasks to be executed in parallel.
+            fifo (bool, optional): Activate ready coroutines in first-in
+                first-out order, for a deterministic execution order.
+                Defaults to `False`, using a faster last-in first-out stack,
+                since scopes do not depend on the order of siblings.
+            inline_when_saturated (bool, optional): When `max_inflight` tasks
+                are running and more are ready, run one of them on the
+                scheduler thread with `Executor.execute` instead of idling.
+                Disable this for executors isolating tasks in other processes.
+                Defaults to `True`.
         """
         self._max_inflight = max_inflight
+        self._fifo = fifo
+        self._inline_when_saturated = inline_when_saturated
 
     def forward(self, context: Context, starters: Sequence[CoroutineFunc], *, executor: Executor) -> Context:
-        from itertools import chain
         # TODO: add checking for circular dependencies!
         scope_manager = ScopeManager(len(starters))
-        ready_nodes: deque[tuple[Coroutine, int]] = deque()
-        event_queue: SimpleQueue[ExecEvent] = SimpleQueue()
+        # Ready coroutines and their scope IDs, pushed and popped in lockstep.
+        ready_coros: MutableSequence[Coroutine]
+        ready_scopes: MutableSequence[int]
+        if self._fifo:
+            ready_coros, ready_scopes = deque(), deque()
+            pop_coro, pop_scope = ready_coros.popleft, ready_scopes.popleft
+        else:
+            ready_coros, ready_scopes = [], []
+            pop_coro, pop_scope = ready_coros.pop, ready_scopes.pop
+        event_queue: SimpleQueue[tuple[int, ExecEvent]] = SimpleQueue()
+
+        ready_coros.extend(n(context) for n in starters)
+        ready_scopes.extend(repeat(0, len(starters)))
+
+        # In-flight tasks are stored in slots indexed by small integers that
+        # are handed to the executor callbacks, reusing freed slots.
+        inflight: list[tuple[Coroutine, int, OrderItem] | None] = []
+        free_slots: list[int] = []
+        num_inflight = 0
+        batch: list[TaskSpec] = []
+
+        # Bind the names used in the loop to locals.
+        max_inflight = self._max_inflight
+        inline_when_saturated = self._inline_when_saturated
+        submit_batch = executor.submit_batch
+        execute = executor.execute
+        put_event = event_queue.put
+        get_event = event_queue.get
+        get_event_nowait = event_queue.get_nowait
 
-        for n in starters:
-            ready_nodes.append((n(context), 0))
+        while True:
+            inlined = not inline_when_saturated
 
-        inflight: dict[TaskID, tuple[Coroutine, int, OrderItem]] = {}
+            while ready_coros:
+                if num_inflight >= max_inflight and inlined:
+                    break
 
-        while True:
-            while ready_nodes and len(inflight) < self._max_inflight:
-                coro, scope_id = ready_nodes.popleft()
+                coro = pop_coro()
+                scope_id = pop_scope()
                 try:
                     order_item = next(coro)
                 except StopIteration:
                     continue
 
                 if order_item.source is None:
-                    self._recruit_downstreams_and_recall_if_scope_done(
-                        coro, ready_nodes, scope_manager, order_item, scope_id
+                    _recruit_and_recall(
+                        coro, ready_coros, ready_scopes, scope_manager, order_item, scope_id
                     )
                     continue
 
-                uid_set: set[int] = set()
-                for expr in chain(order_item.args, order_item.kwargs.values()):
-                    uid_set |= expr.refs()
+                uid_set: frozenset[int] = order_item.deps # type: ignore[assignment] # set for sourced orders
 
-                tid = executor.submit(
-                    order_item.source, order_item.context.view(uid_set),
-                    order_item.args, order_item.kwargs,
-                    callback=lambda event: event_queue.put(event)
-                )
-                inflight[tid] = (coro, scope_id, order_item)
+                if num_inflight >= max_inflight:
+                    if batch:
+                        submit_batch(batch)
+                        batch = []
+                    event = execute(
+                        order_item.source, order_item.context.view(uid_set),
+                        order_item.args, order_item.kwargs
+                    )
+                    _finish_task(
+                        event, coro, ready_coros, ready_scopes, scope_manager, order_item, scope_id
+                    )
+                    inlined = True
+                    continue
 
-            if len(inflight) == 0:
-                break
+                if free_slots:
+                    slot = free_slots.pop()
+                    inflight[slot] = (coro, scope_id, order_item)
+                else:
+                    slot = len(inflight)
+                    inflight.append((coro, scope_id, order_item))
+                num_inflight += 1
 
-            event = event_queue.get()
+                def callback(event: ExecEvent, slot: int = slot) -> None:
+                    put_event((slot, event))
 
-            if event.task_id is None: # executor-level events
-                break
-            else:
-                coro, scope_id, order_item = inflight.pop(event.task_id)
-                if event.is_success():
-                    if event.value is not None:
-                        order_item.context[order_item.uid] = event.value
-                    self._recruit_downstreams_and_recall_if_scope_done(
-                        coro, ready_nodes, scope_manager, order_item, scope_id
-                    )
-                else:
-                    scope_manager.on_node_complete(scope_id)
-                    self._recall_if_scope_done(ready_nodes, scope_manager, scope_id)
+                batch.append((
+                    order_item.source, order_item.context.view(uid_set),
+                    order_item.args, order_item.kwargs, callback
+                ))
 
-        return context
+            if batch:
+                submit_batch(batch)
+                batch = []
 
-    @classmethod
-    def _recruit_downstreams_and_recall_if_scope_done(
-        cls,
-        coro: Coroutine,
-        ready_nodes: deque[tuple[Coroutine, int]],
-        scope_manager: ScopeManager,
-        order_item: OrderItem,
-        scope_id: int
-    ) -> None:
-        # If already been cancelled by other nodes, do nothing
-        if scope_manager.check_scope_done(scope_id):
-            return
+            if num_inflight == 0:
+                break
 
-        if order_item.control == FlowControl.AWAIT:
-            scope_id = scope_manager.create_scope(scope_id, coro)
+            # Block for one event, then reap all the events already queued
+            # before refilling the executor.
+            slot, event = get_event()
 
-        elif order_item.control == FlowControl.EXIT:
-            scope_id = scope_manager.cancel_scope(scope_id)
+            while True:
+                if event.task_id is None: # executor-level events
+                    return context
 
-        elif order_item.control == FlowControl.NONE:
-            scope_manager.on_node_complete(scope_id)
+                coro, scope_id, order_item = inflight[slot] # type: ignore
+                inflight[slot] = None
+                free_slots.append(slot)
+                num_inflight -= 1
+                _finish_task(
+                    event, coro, ready_coros, ready_scopes, scope_manager, order_item, scope_id
+                )
 
-        else:
-            raise ValueError(f"Invalid control flow: {order_item.control!r}")
-
-        if order_item.recruit:
-            scope_manager.on_recruit(scope_id, len(order_item.recruit))
-            for nxt in order_item.recruit:
-                ready_nodes.append((nxt(order_item.context), scope_id))
-
-        cls._recall_if_scope_done(ready_nodes, scope_manager, scope_id)
-
-    @classmethod
-    def _recall_if_scope_done(
-        cls,
-        ready_nodes: deque[tuple[Coroutine, int]],
-        scope_manager: ScopeManager,
-        scope_id: int
-    ):
-        if scope_manager.check_scope_done(scope_id):
-            recall_and_back_id = scope_manager.get_recall(scope_id)
-            if recall_and_back_id:
-                ready_nodes.append(recall_and_back_id)
+                try:
+                    slot, event = get_event_nowait()
+                except Empty:
+                    break
+
+        return context
@@ -1,24 +1,62 @@
 
 __all__ = ["expression", "nodal"]
 
-from typing import Any
+from functools import partial
+from typing import Any, overload
 from collections.abc import Callable
 
+from .core._objbase import has_entity
+from .core.executor import Executor, JitMode
+from .core.expr import FunctionExpr
+from .core.node import Execute
 
-def expression(func: Callable[..., Any], /):
-    """A decorator that transforms a function into an expression operator."""
-    from functools import partial
-    from .core.executor import Executor
-    from .core.expr import FunctionExpr
+
+# Expression operators by fid, so that decorating a function again is free.
+_EXPR_PARTIALS: dict[int, Callable[..., FunctionExpr]] = {}
+
+
+@overload
+def expression(func: Callable[..., Any], /) -> Callable[..., FunctionExpr]: ...
+@overload
+def expression(*, jit: JitMode | None = None) -> Callable[[Callable[..., Any]], Callable[..., FunctionExpr]]: ...
+def expression(func: Callable[..., Any] | None = None, /, *, jit: JitMode | None = None):
+    """A decorator that transforms a function into an expression operator.
+
+    Use `@expression(jit="numba")` or `@expression(jit="auto")` to compile
+    the function with numba first, see `Executor.jit`. Only functions on
+    numpy arrays and primitive values can be compiled.
+    """
+    if func is None:
+        return partial(expression, jit=jit)
 
     fid = Executor.register(func)
-    return partial(FunctionExpr, fid)
+    if jit is not None:
+        fid = Executor.jit(fid, jit)
+    operator = _EXPR_PARTIALS.get(fid)
+
+    if operator is None:
+        operator = partial(FunctionExpr, fid)
+        _EXPR_PARTIALS[fid] = operator
+
+    return operator
+
 
+@overload
+def nodal(func: Callable[..., Any], /) -> Execute: ...
+@overload
+def nodal(*, jit: JitMode | None = None) -> Callable[[Callable[..., Any]], Execute]: ...
+def nodal(func: Callable[..., Any] | None = None, /, *, jit: JitMode | None = None):
+    """A decorator that transform a function into an execution node.
 
-def nodal(func: Callable[..., Any], /):
-    """A decorator that transform a function into an execution node."""
-    from .core.executor import Executor
-    from .core.node import Execute
+    Use `@nodal(jit="numba")` or `@nodal(jit="auto")` to compile the
+    function with numba first, see `Executor.jit`. Only functions on numpy
+    arrays and primitive values can be compiled.
+    """
+    if func is None:
+        return partial(nodal, jit=jit)
 
     fid = Executor.register(func)
-    return Execute(fid, uid=fid)
+    if jit is not None:
+        fid = Executor.jit(fid, jit)
+    # The first node of a function takes its fid as UID.
+    return Execute(fid, uid=None if has_entity(fid) else fid)